@@ -2,29 +2,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import plotly.express as px
 import plotly.graph_objects as go
-import geopandas as gpd
-from shapely.geometry import Point
-from datetime import datetime
-import leafmap.foliumap as leafmap
-from PIL import Image
-import xarray as xr
-import os
-import tempfile
+import zlib
 import requests
+from requests.adapters import HTTPAdapter
 
-# Set page configuration
-st.set_page_config(
-    page_title="Climate Impact on SA Agriculture",
-    page_icon="🌾",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS
-st.markdown("""
+# Static page markup
+_CSS = """
 <style>
     .reportview-container {
         background: #000000;
@@ -78,17 +63,141 @@ st.markdown("""
         margin-bottom: -1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-
-# Title and introduction
-st.title("🌾 Climate Change Impact on South African Agriculture")
-st.markdown("""
+_HEADER_HTML = """
 <div style="text-align: center; margin-bottom: 30px;">
     <h3 class="header-text">Analyzing Climate Risks to Food Security</h3>
     <p>This dashboard assesses the impact of climate change on key agricultural regions in South Africa using satellite imagery and climate models.</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+_TAB1_STATIC = """
+## South Africa's Key Agricultural Regions
+
+<div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+    <p>South Africa has diverse agricultural regions facing different climate risks. 
+    This section provides an overview of key farming areas and their vulnerability to climate change.</p>
+</div>
+"""
+
+_TAB2_STATIC = """
+## Satellite-Based Crop Health Monitoring
+
+<div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+    <p>Using Sentinel-2 satellite data, we analyze vegetation health through the NDVI index. 
+    This helps monitor crop stress and predict yields.</p>
+</div>
+"""
+
+_TAB2_NDVI_STATIC = """
+---
+
+### NDVI Analysis
+
+**Normalized Difference Vegetation Index (NDVI)** measures plant health:
+- Values near 1: Healthy vegetation
+- Values near 0: Bare soil
+- Negative values: Water
+"""
+
+_TAB3_STATIC = """
+## Historical Climate Trends
+
+<div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+    <p>Analyzing temperature and rainfall patterns over time to understand climate impacts on agriculture.</p>
+</div>
+"""
+
+_TAB4_STATIC = """
+## Future Climate Projections
+
+<div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+    <p>Using climate models to project future impacts on agriculture and identify vulnerable regions.</p>
+</div>
+"""
+
+_TAB5_STATIC = """
+## Adaptation Recommendations
+
+<div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
+    <p>Evidence-based strategies to enhance climate resilience in South African agriculture.</p>
+</div>
+"""
+
+_TIMELINE_DATA = {
+    "Phase": ["Short-Term (1-3 years)", "Medium-Term (3-7 years)", "Long-Term (7-15 years)"],
+    "Key Actions": [
+        "Pilot adaptation projects, farmer training, early warning systems",
+        "Scale successful pilots, develop resilient supply chains, policy reform",
+        "Transformational change, climate-resilient infrastructure, diversified agricultural economy"
+    ],
+    "Estimated Cost (ZAR billion)": [3.5, 8.2, 15.0]
+}
+
+# Pre-rendered once: the timeline is a static table, so it doesn't need an interactive grid
+_TIMELINE_MD = "\n".join([
+    "| " + " | ".join(_TIMELINE_DATA) + " |",
+    "| :--- | :--- | ---: |",
+    *(
+        f"| {phase} | {actions} | {cost:.1f} |"
+        for phase, actions, cost in zip(*_TIMELINE_DATA.values())
+    )
+])
+
+# Policy box, timeline table and funding heading are contiguous, so they go out in one call
+_TAB5_POLICY_STATIC = f"""
+### Policy Recommendations
+
+<div style="background-color: #0d0d0d; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
+    <h4>National Climate Adaptation Framework</h4>
+    <ol>
+        <li>Establish a National Climate Resilience Fund for Agriculture</li>
+        <li>Integrate climate risk assessments into agricultural planning</li>
+        <li>Develop early warning systems for extreme weather events</li>
+        <li>Promote climate-smart agricultural practices nationwide</li>
+        <li>Support research on climate-resilient crop varieties</li>
+    </ol>
+</div>
+
+### Implementation Timeline
+
+{_TIMELINE_MD}
+
+### Funding Opportunities
+"""
+
+_FOOTER_HTML = """
+<hr>
+<div style="text-align: center; color: #666; font-size: 14px; padding-top: 20px;">
+    <p>Climate Change Impact on South African Agriculture Dashboard • Developed with Streamlit</p>
+    <p>Data Sources: Sentinel-2 Satellite Imagery, South African Weather Service, Agricultural Research Council</p>
+    <p>Disclaimer: This is a demonstration tool. For official assessments, consult relevant authorities.</p>
+</div>
+"""
+
+# Plotly client config shared by every chart: no logo, no unused selection tools
+_PLOTLY_CFG = {
+    "displaylogo": False,
+    "modeBarButtonsToRemove": ["lasso2d", "select2d", "autoScale2d"],
+    "responsive": True
+}
+
+# Set page configuration
+st.set_page_config(
+    page_title="Climate Impact on SA Agriculture",
+    page_icon="🌾",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+# Title and introduction
+st.title("🌾 Climate Change Impact on South African Agriculture")
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 # Create tabs for different sections
@@ -100,6 +209,28 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "📝 Recommendations"
 ])
 
+# Fixed seed so the synthetic sample data is identical across reruns and processes
+_SEED = 20240101
+_RNG = np.random.default_rng(_SEED)
+
+# Numeric generators for the sample data; offsets are years since 2010
+def _gen_climate(n_years, rng):
+    offsets = np.arange(n_years)
+    temp_change = 0.1 * offsets + rng.normal(0, 0.2, n_years)
+    rainfall_change = -2.0 * offsets + rng.normal(0, 3.0, n_years)
+    return temp_change, rainfall_change
+
+def _gen_crop_health(n_regions, n_years, rng):
+    offsets = np.tile(np.arange(n_years), n_regions)
+    return np.maximum(60, 80 - 0.8 * offsets + rng.normal(0, 5, offsets.size))
+
+def _gen_projections(start_offset, n_years, rng):
+    offsets = np.arange(start_offset, start_offset + n_years)
+    temp_change = 0.15 * offsets + rng.normal(0, 0.3, n_years)
+    rainfall_change = -3.0 * offsets + rng.normal(0, 5, n_years)
+    crop_health = np.maximum(40, 80 - 1.0 * offsets + rng.normal(0, 6, n_years))
+    return temp_change, rainfall_change, crop_health
+
 # Load sample data (in a real application, this would be connected to actual data sources)
 @st.cache_data
 def load_data():
@@ -111,55 +242,401 @@ def load_data():
     }
     
     # Load climate data (sample)
-    years = list(range(2010, 2024))
-    temp_change = [0.1 * (year - 2010) + np.random.normal(0, 0.2) for year in years]
-    rainfall_change = [-2 * (year - 2010) + np.random.normal(0, 3) for year in years]
+    years = np.arange(2010, 2024)
+    temp_change, rainfall_change = _gen_climate(years.size, _RNG)
     climate_df = pd.DataFrame({
         "Year": years,
         "Temperature Change (°C)": temp_change,
         "Rainfall Change (%)": rainfall_change
     })
     
-    # Load crop health data
-    crop_health = []
-    for region in regions:
-        for year in years:
-            health = 80 - 0.8 * (year - 2010) + np.random.normal(0, 5)
-            crop_health.append({
-                "Region": region,
-                "Year": year,
-                "Crop Health Index": max(60, health),
-                "Crop Type": "Wheat" if "Wheat" in region else "Maize" if "Maize" in region else "Sugarcane"
-            })
-    crop_health_df = pd.DataFrame(crop_health)
+    # Load crop health data (one row per region and year)
+    region_names = np.array(list(regions))
+    crop_types = np.select(
+        [np.char.find(region_names, "Wheat") >= 0, np.char.find(region_names, "Maize") >= 0],
+        ["Wheat", "Maize"],
+        default="Sugarcane"
+    )
+    crop_health_df = pd.DataFrame({
+        "Region": np.repeat(region_names, years.size),
+        "Year": np.tile(years.astype(np.int32), region_names.size),
+        "Crop Health Index": _gen_crop_health(region_names.size, years.size, _RNG),
+        "Crop Type": np.repeat(crop_types, years.size)
+    }, copy=False)
     
     # Load future projections
-    future_years = list(range(2024, 2050))
-    future_temp = [0.15 * (year - 2010) + np.random.normal(0, 0.3) for year in future_years]
-    future_rain = [-3 * (year - 2010) + np.random.normal(0, 5) for year in future_years]
-    future_health = [80 - 1.0 * (year - 2010) + np.random.normal(0, 6) for year in future_years]
+    future_years = np.arange(2024, 2050)
+    future_temp, future_rain, future_health = _gen_projections(future_years[0] - 2010, future_years.size, _RNG)
     
     projections_df = pd.DataFrame({
         "Year": future_years,
         "Projected Temp Change": future_temp,
         "Projected Rainfall Change": future_rain,
-        "Projected Crop Health": [max(40, h) for h in future_health]
+        "Projected Crop Health": future_health
     })
     
     return regions, climate_df, crop_health_df, projections_df
 
 regions, climate_df, crop_health_df, projections_df = load_data()
 
+# Static reference tables shown in the tabs
+_VULN_DATA = {
+    "Region": list(regions.keys()),
+    "Crop Type": ["Wheat", "Maize", "Sugarcane"],
+    "Temperature Risk": [3, 2, 4],
+    "Drought Risk": [4, 3, 2],
+    "Flood Risk": [1, 2, 3],
+    "Overall Risk": [3.2, 2.8, 3.0]
+}
+
+_VULN_MAP_DATA = {
+    "Region": list(regions.keys()) + ["Other Areas"],
+    "Latitude": [-33.5, -28.0, -29.0, -28.5],
+    "Longitude": [19.5, 27.0, 31.0, 24.0],
+    "Risk Level": ["High", "Very High", "Medium", "Low"],
+    "Risk Score": [8.2, 9.1, 6.5, 3.2],
+    "Main Threat": ["Drought", "Heat Stress", "Flooding", "Moderate Change"]
+}
+
+_DROUGHT_DATA = {
+    "Year": list(range(2010, 2024)),
+    "Drought Days": [15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80],
+    "Severity": [1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5]
+}
+
+_STRAT_DATA = {
+    "Strategy": [
+        "Drought-resistant crops",
+        "Precision irrigation",
+        "Crop rotation",
+        "Soil conservation",
+        "Agroforestry"
+    ],
+    "Effectiveness (%)": [85, 75, 60, 70, 65],
+    "Cost (relative)": [40, 70, 30, 50, 60]
+}
+
+_FUNDING_DATA = {
+    "Source": [
+        "Green Climate Fund", 
+        "World Bank Climate Investment Funds",
+        "National Treasury",
+        "Private Sector Partnerships"
+    ],
+    "Focus Area": [
+        "Large-scale adaptation projects",
+        "Technology transfer and capacity building",
+        "Domestic subsidy programs",
+        "Innovation and market-based solutions"
+    ],
+    "Potential Amount (ZAR billion)": [5.0, 3.2, 2.5, 4.0]
+}
+
+
+# Per-tab sample frames, cached so widget interactions don't rebuild them
+@st.cache_data
+def _vuln_frame():
+    return pd.DataFrame(_VULN_DATA)
+
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_NDVI_BY_REGION = {
+    "Western Cape Wheat": np.array([0.15, 0.45, 0.65, 0.75, 0.85, 0.82, 0.78, 0.70, 0.60, 0.40, 0.25, 0.18]),
+    "Free State Maize": np.array([0.20, 0.35, 0.60, 0.75, 0.85, 0.88, 0.90, 0.85, 0.75, 0.55, 0.35, 0.22]),
+    "KZN Sugarcane": np.array([0.45, 0.55, 0.65, 0.75, 0.80, 0.82, 0.85, 0.84, 0.82, 0.78, 0.70, 0.60])
+}
+
+@st.cache_data
+def _ndvi_frame(region):
+    return pd.DataFrame({"Month": list(_MONTHS), "NDVI": _NDVI_BY_REGION[region]})
+
+@st.cache_data
+def _health_lookup():
+    # load_data() emits exactly one row per (Region, Year), so no aggregation is needed
+    return crop_health_df.set_index(["Region", "Year"])["Crop Health Index"]
+
+_BASE_TEMP_BY_REGION = {
+    "Western Cape Wheat": 22.5,
+    "Free State Maize": 24.0,
+    "KZN Sugarcane": 26.5
+}
+
+@st.cache_data
+def _regional_temp(region: str) -> pd.DataFrame:
+    # Child seed from a stable hash of the region name so each region keeps its own series
+    region_rng = np.random.default_rng([_SEED, zlib.crc32(region.encode())])
+    years = np.arange(2010, 2024)
+    avg_temp = _BASE_TEMP_BY_REGION[region] + 0.08 * (years - 2010) + region_rng.normal(0, 0.15, years.size)
+    return pd.DataFrame({
+        "Year": years,
+        "Average Temperature (°C)": avg_temp,
+        "Max Temperature": avg_temp + 5,
+        "Min Temperature": avg_temp - 5
+    })
+
+@st.cache_data
+def _drought_frame():
+    return pd.DataFrame(_DROUGHT_DATA)
+
+_YIELD_SLOPE_BY_SCENARIO = {"low": 0.5, "mod": 1.0, "high": 2.0}
+
+@st.cache_data
+def _yield_frame(scenario_key: str) -> pd.DataFrame:
+    years = np.arange(2024, 2050)
+    yields = 100 - _YIELD_SLOPE_BY_SCENARIO[scenario_key] * (years - 2024)
+    return pd.DataFrame({"Year": years, "Projected Yield (%)": yields})
+
+@st.cache_data
+def _vuln_map_frame():
+    vuln_df = pd.DataFrame(_VULN_MAP_DATA)
+    vuln_df["hover"] = vuln_df["Region"].astype("string") + " — " + vuln_df["Main Threat"].astype("string")
+    return vuln_df
+
+@st.cache_data
+def _strat_frame():
+    return pd.DataFrame(_STRAT_DATA)
+
+
+# Plotly figures, built once per input and reused across reruns. The Figure itself is cached
+# rather than its JSON: st.plotly_chart rebuilds and re-validates a Figure from dict/JSON input.
+@st.cache_resource
+def build_radar_fig():
+    vuln_df = _vuln_frame()
+    theta = ['Temperature Risk', 'Drought Risk', 'Flood Risk', 'Overall Risk']
+    risks = vuln_df[theta].to_numpy()
+    fig = go.Figure()
+    
+    for region, r in zip(vuln_df["Region"].tolist(), risks):
+        fig.add_trace(go.Scatterpolar(
+            r=r,
+            theta=theta,
+            fill='toself',
+            name=region
+        ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 5]
+            )),
+        showlegend=True,
+        height=400,
+        title="Climate Risk by Region (1-5 scale)"
+    )
+    return fig
+
+@st.cache_resource
+def build_regional_temp_fig(region):
+    temp_df = _regional_temp(region)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=temp_df["Year"], y=temp_df["Max Temperature"],
+        fill=None, mode='lines', line_color='red', name='Max Temp'
+    ))
+    fig.add_trace(go.Scatter(
+        x=temp_df["Year"], y=temp_df["Min Temperature"],
+        fill='tonexty', mode='lines', line_color='blue', name='Min Temp'
+    ))
+    fig.add_trace(go.Scatter(
+        x=temp_df["Year"], y=temp_df["Average Temperature (°C)"],
+        mode='lines+markers', line=dict(color='black', width=2), name='Avg Temp'
+    ))
+    fig.update_layout(
+        title=f"Temperature Trends: {region}",
+        yaxis_title="Temperature (°C)",
+        showlegend=True
+    )
+    return fig
+
+@st.cache_resource
+def build_drought_fig():
+    drought_df = _drought_frame()
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=drought_df["Year"], y=drought_df["Drought Days"],
+        name='Drought Days',
+        marker_color='orange'
+    ))
+    fig.add_trace(go.Scatter(
+        x=drought_df["Year"], y=drought_df["Severity"]*20,
+        mode='lines+markers', name='Severity (1-5 scale)',
+        line=dict(color='red', width=3)
+    ))
+    fig.update_layout(
+        title="Increasing Drought Frequency and Severity",
+        yaxis_title="Drought Days/Year",
+        yaxis2=dict(
+            title="Severity (scaled)",
+            overlaying="y",
+            side="right",
+            range=[0, 100]
+        ),
+        showlegend=True
+    )
+    return fig
+
+@st.cache_resource
+def build_projection_fig():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=projections_df["Year"], y=projections_df["Projected Temp Change"],
+        mode='lines+markers', name='Temperature Change',
+        line=dict(color='red', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=projections_df["Year"], y=projections_df["Projected Rainfall Change"],
+        mode='lines+markers', name='Rainfall Change',
+        line=dict(color='blue', width=3),
+        yaxis="y2"
+    ))
+
+    # FIXED SECTION - Updated axis title styling
+    fig.update_layout(
+        title="Projected Climate Change (2024-2050)",
+        yaxis=dict(
+            title=dict(text="Temperature Change (°C)", font=dict(color="red"))
+        ),
+        yaxis2=dict(
+            title=dict(text="Rainfall Change (%)", font=dict(color="blue")),
+            overlaying="y",
+            side="right"
+        ),
+        showlegend=True
+    )
+    return fig
+
+@st.cache_resource
+def build_yield_fig(scenario):
+    scenario_key = "low" if scenario.startswith("Low") else "mod" if scenario.startswith("Moderate") else "high"
+    fig = px.line(_yield_frame(scenario_key), x="Year", y="Projected Yield (%)", 
+                 title=f"Projected Crop Yield: {scenario}",
+                 markers=True)
+    fig.update_layout(yaxis_title="Yield as % of 2020 Baseline")
+    return fig
+
+@st.cache_resource
+def build_vuln_map_fig():
+    fig = px.scatter_mapbox(_vuln_map_frame(), lat="Latitude", lon="Longitude", 
+                           color="Risk Level", size="Risk Score",
+                           hover_name="hover", hover_data=None,
+                           color_discrete_map={
+                               "Very High": "red",
+                               "High": "orange",
+                               "Medium": "yellow",
+                               "Low": "green"
+                           },
+                           zoom=5, height=500)
+    
+    fig.update_layout(mapbox_style="open-street-map")
+    fig.update_layout(margin={"r":0,"t":0,"l":0,"b":0})
+    return fig
+
+@st.cache_resource
+def build_strategies_fig():
+    return px.bar(_strat_frame(), x="Strategy", y="Effectiveness (%)",
+                 color="Cost (relative)",
+                 title="Effectiveness of Adaptation Strategies",
+                 color_continuous_scale=px.colors.sequential.Viridis)
+
+@st.cache_resource
+def build_funding_fig():
+    # One go.Bar per focus area (each source has its own), skipping Plotly Express grouping
+    fig = go.Figure(data=[
+        go.Bar(x=[source], y=[amount], name=focus_area, marker_color=colour)
+        for source, focus_area, amount, colour in zip(
+            _FUNDING_DATA["Source"],
+            _FUNDING_DATA["Focus Area"],
+            _FUNDING_DATA["Potential Amount (ZAR billion)"],
+            px.colors.qualitative.Plotly
+        )
+    ])
+    fig.update_layout(
+        title="Climate Adaptation Funding Sources",
+        xaxis_title="Source",
+        yaxis_title="Potential Amount (ZAR billion)",
+        legend_title_text="Focus Area",
+        barmode="relative"
+    )
+    return fig
+
+
+# Static regions map, built once per set of region bounding boxes
+@st.cache_resource
+def build_regions_map(regions_key):
+    # leafmap pulls in folium and its geo stack, so only import it when the map is first built
+    import leafmap.foliumap as leafmap
+    import folium
+    
+    # Create an interactive map with proper attribution
+    m = leafmap.Map(center=[-28.5, 25], zoom=5)
+    m.add_tile_layer(
+        url="https://{s}.tile.opentopomap.org/{z}/{x}/{y}.png",
+        name="OpenTopoMap",
+        attribution="Map data: © OpenStreetMap contributors, SRTM | Map style: © OpenTopoMap (CC-BY-SA)"
+    )
+    
+    # Create a FeatureCollection with one polygon per region
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[
+                    [bbox[0], bbox[1]],  # SW
+                    [bbox[2], bbox[1]],  # SE
+                    [bbox[2], bbox[3]],  # NE
+                    [bbox[0], bbox[3]],  # NW
+                    [bbox[0], bbox[1]]   # SW
+                ]]
+            },
+            "properties": {"name": region}
+        }
+        for region, bbox in regions_key
+    ]
+    m.add_geojson(
+        {"type": "FeatureCollection", "features": features},
+        layer_name="Agricultural Regions",
+        style={"color": "green", "fillColor": "green", "fillOpacity": 0.5}
+    )
+    
+    # Add a label at the center of each region, grouped so they form a single map layer
+    labels = folium.FeatureGroup(name="Region Labels", control=False)
+    for region, bbox in regions_key:
+        center_lat = (bbox[1] + bbox[3]) / 2
+        center_lon = (bbox[0] + bbox[2]) / 2
+        folium.Marker([center_lat, center_lon], popup=region, font_size=12).add_to(labels)
+    labels.add_to(m)
+    return m
+
+
+# Remote images, downloaded once over a pooled session
+@st.cache_resource
+def _http_session():
+    session = requests.Session()
+    # Wikimedia's User-Agent policy asks for a descriptive agent; generic ones may be blocked
+    session.headers["User-Agent"] = (
+        "ClimateChange-ImpactOnAgriculture-Dashboard/1.0 "
+        "(https://github.com/callmeAyanda/ClimateChange_ImpactOnAgriculture_Project)"
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def fetch_image(url):
+    response = _http_session().get(url, timeout=10)
+    response.raise_for_status()
+    # Error or captive-portal pages can come back as 200; raise so they are never cached
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith("image/"):
+        raise ValueError(f"Expected an image from {url}, got Content-Type {content_type!r}")
+    return response.content
+
 
 # Tab 1: Regional Overview
 with tab1:
-    st.header("South Africa's Key Agricultural Regions")
-    st.markdown("""
-    <div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <p>South Africa has diverse agricultural regions facing different climate risks. 
-        This section provides an overview of key farming areas and their vulnerability to climate change.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TAB1_STATIC, unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -167,53 +644,8 @@ with tab1:
     with col1:
         st.subheader("Agricultural Regions Map")
         
-        # Create an interactive map with proper attribution
-        m = leafmap.Map(center=[-28.5, 25], zoom=5)
-        m.add_tile_layer(
-            url="https://{s}.tile.opentopomap.org/{z}/{x}/{y}.png",
-            name="OpenTopoMap",
-            attribution="Map data: © OpenStreetMap contributors, SRTM | Map style: © OpenTopoMap (CC-BY-SA)"
-        )
+        m = build_regions_map(tuple(sorted((k, tuple(v["bbox"])) for k, v in regions.items())))
         
-        # Create a FeatureCollection for all regions
-        features = []
-        for region, data in regions.items():
-            bbox = data["bbox"]
-            # Create GeoJSON feature for each region
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [[
-                        [bbox[0], bbox[1]],  # SW
-                        [bbox[2], bbox[1]],  # SE
-                        [bbox[2], bbox[3]],  # NE
-                        [bbox[0], bbox[3]],  # NW
-                        [bbox[0], bbox[1]]   # SW
-                    ]]
-                },
-                "properties": {"name": region}
-            }
-            features.append(feature)
-
-            # Add label at center
-            center_lat = (bbox[1] + bbox[3]) / 2
-            center_lon = (bbox[0] + bbox[2]) / 2
-            m.add_marker([center_lat, center_lon], region, font_size=12)
-            
-
-            # Create FeatureCollection and add to map
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features
-        }
-            # Add to map with styling
-        m.add_geojson(
-                geojson,
-                layer_name=region,
-                style={"color": "green", "fillColor": "green", "fillOpacity": 0.5}
-            )
-            
         # Display the map
         m.to_streamlit(height=500)
     
@@ -221,40 +653,8 @@ with tab1:
     with col2:
         st.subheader("Region Vulnerability Assessment")
         
-        # Create vulnerability data
-        vulnerability_data = {
-            "Region": list(regions.keys()),
-            "Crop Type": ["Wheat", "Maize", "Sugarcane"],
-            "Temperature Risk": [3, 2, 4],
-            "Drought Risk": [4, 3, 2],
-            "Flood Risk": [1, 2, 3],
-            "Overall Risk": [3.2, 2.8, 3.0]
-        }
-        vuln_df = pd.DataFrame(vulnerability_data)
-        
         # Display as radar chart
-        fig = go.Figure()
-        
-        for i, row in vuln_df.iterrows():
-            fig.add_trace(go.Scatterpolar(
-                r=[row["Temperature Risk"], row["Drought Risk"], row["Flood Risk"], row["Overall Risk"]],
-                theta=['Temperature Risk', 'Drought Risk', 'Flood Risk', 'Overall Risk'],
-                fill='toself',
-                name=row["Region"]
-            ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 5]
-                )),
-            showlegend=True,
-            height=400,
-            title="Climate Risk by Region (1-5 scale)"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_radar_fig(), use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("""
         <div style="background-color: #191919; padding: 10px; border-radius: 5px; margin-top: 20px;">
@@ -271,13 +671,7 @@ with tab1:
 
 # Tab 2: Crop Health Analysis
 with tab2:
-    st.header("Satellite-Based Crop Health Monitoring")
-    st.markdown("""
-    <div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <p>Using Sentinel-2 satellite data, we analyze vegetation health through the NDVI index. 
-        This helps monitor crop stress and predict yields.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TAB2_STATIC, unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -323,31 +717,15 @@ with tab2:
         # Display selected season
         st.markdown(f"**Selected Season:** {st.session_state.crop_season}")
         
-        st.markdown("---")
-        st.markdown("### NDVI Analysis")
-        st.markdown("""
-        **Normalized Difference Vegetation Index (NDVI)** measures plant health:
-        - Values near 1: Healthy vegetation
-        - Values near 0: Bare soil
-        - Negative values: Water
-        """)
+        st.markdown(_TAB2_NDVI_STATIC)
         
-        # Simulate NDVI data
-        if region == "Western Cape Wheat":
-            ndvi_values = [0.15, 0.45, 0.65, 0.75, 0.85, 0.82, 0.78, 0.70, 0.60, 0.40, 0.25, 0.18]
-        elif region == "Free State Maize":
-            ndvi_values = [0.20, 0.35, 0.60, 0.75, 0.85, 0.88, 0.90, 0.85, 0.75, 0.55, 0.35, 0.22]
-        else:  # KZN Sugarcane
-            ndvi_values = [0.45, 0.55, 0.65, 0.75, 0.80, 0.82, 0.85, 0.84, 0.82, 0.78, 0.70, 0.60]
-        
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        ndvi_df = pd.DataFrame({"Month": months, "NDVI": ndvi_values})
+        ndvi_df = _ndvi_frame(region)
         
         fig = px.line(ndvi_df, x="Month", y="NDVI", 
                       title=f"Monthly NDVI Trend: {region} ({year})",
                       markers=True)
         fig.update_layout(yaxis_title="NDVI", yaxis_range=[0, 1])
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CFG)
     
 
     # Column 2
@@ -364,25 +742,18 @@ with tab2:
         
         try:
             # Display the image with proper error handling
-            response = requests.get(image_urls[region], stream=True)
-            if response.status_code == 200:
-                img = Image.open(response.raw)
-                st.image(img, 
-                        caption=f"Sentinel-2 Imagery: {region} ({st.session_state.crop_season} {year})", 
-                        width=500)
-            else:
-                raise Exception(f"HTTP Error: {response.status_code}")
+            st.image(fetch_image(image_urls[region]), 
+                    caption=f"Sentinel-2 Imagery: {region} ({st.session_state.crop_season} {year})", 
+                    width=500,
+                    output_format="JPEG")
         except Exception as e:
             st.warning(f"Unable to load satellite image. Error: {str(e)}")
-            # Display a relevant placeholder
+            # Display a relevant placeholder, loaded by the browser since the server fetch just failed
             st.image("https://images.unsplash.com/photo-1500382017468-9049fed747ef?ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&w=600&q=80", 
                     use_container_width=True)
         
         # Health indicator
-        health_value = crop_health_df[
-            (crop_health_df["Region"] == region) & 
-            (crop_health_df["Year"] == year)
-        ]["Crop Health Index"].mean()
+        health_value = float(_health_lookup().loc[(region, year)])
         
         st.markdown(f"### Crop Health Index: **{health_value:.1f}/100**")
         
@@ -407,7 +778,7 @@ with tab2:
         ))
         
         fig.update_layout(height=250)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("""
         <div style="background-color: #191919; padding: 10px; border-radius: 5px; margin-top: 10px;">
@@ -423,12 +794,7 @@ with tab2:
 
 # Tab 3: Climate Trends
 with tab3:
-    st.header("Historical Climate Trends")
-    st.markdown("""
-    <div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <p>Analyzing temperature and rainfall patterns over time to understand climate impacts on agriculture.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TAB3_STATIC, unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -439,43 +805,12 @@ with tab3:
                      title="Temperature Change from Baseline (1990-2000)",
                      markers=True)
         fig.update_layout(yaxis_title="Temperature Change (°C)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("### Regional Temperature Analysis")
         region = st.selectbox("Select Region", list(regions.keys()), key="temp_region")
         
-        # Simulate regional temperature data
-        temp_data = []
-        for year in range(2010, 2024):
-            base_temp = 22.5 if region == "Western Cape Wheat" else 24.0 if region == "Free State Maize" else 26.5
-            change = 0.08 * (year - 2010) + np.random.normal(0, 0.15)
-            temp_data.append({
-                "Year": year,
-                "Average Temperature (°C)": base_temp + change,
-                "Max Temperature": base_temp + 5 + change,
-                "Min Temperature": base_temp - 5 + change
-            })
-        temp_df = pd.DataFrame(temp_data)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=temp_df["Year"], y=temp_df["Max Temperature"],
-            fill=None, mode='lines', line_color='red', name='Max Temp'
-        ))
-        fig.add_trace(go.Scatter(
-            x=temp_df["Year"], y=temp_df["Min Temperature"],
-            fill='tonexty', mode='lines', line_color='blue', name='Min Temp'
-        ))
-        fig.add_trace(go.Scatter(
-            x=temp_df["Year"], y=temp_df["Average Temperature (°C)"],
-            mode='lines+markers', line=dict(color='black', width=2), name='Avg Temp'
-        ))
-        fig.update_layout(
-            title=f"Temperature Trends: {region}",
-            yaxis_title="Temperature (°C)",
-            showlegend=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_regional_temp_fig(region), use_container_width=True, config=_PLOTLY_CFG)
     
 
     # Column 2
@@ -486,41 +821,11 @@ with tab3:
                     color="Rainfall Change (%)",
                     color_continuous_scale=px.colors.sequential.Blues)
         fig.update_layout(yaxis_title="Rainfall Change (%)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("### Drought Frequency Analysis")
         
-        # Create drought data
-        drought_data = {
-            "Year": list(range(2010, 2024)),
-            "Drought Days": [15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80],
-            "Severity": [1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5]
-        }
-        drought_df = pd.DataFrame(drought_data)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=drought_df["Year"], y=drought_df["Drought Days"],
-            name='Drought Days',
-            marker_color='orange'
-        ))
-        fig.add_trace(go.Scatter(
-            x=drought_df["Year"], y=drought_df["Severity"]*20,
-            mode='lines+markers', name='Severity (1-5 scale)',
-            line=dict(color='red', width=3)
-        ))
-        fig.update_layout(
-            title="Increasing Drought Frequency and Severity",
-            yaxis_title="Drought Days/Year",
-            yaxis2=dict(
-                title="Severity (scaled)",
-                overlaying="y",
-                side="right",
-                range=[0, 100]
-            ),
-            showlegend=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_drought_fig(), use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("""
         <div style="background-color: #191919; padding: 10px; border-radius: 5px; margin-top: 20px;">
@@ -537,45 +842,14 @@ with tab3:
 
 # Tab 4: Future Projections
 with tab4:
-    st.header("Future Climate Projections")
-    st.markdown("""
-    <div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <p>Using climate models to project future impacts on agriculture and identify vulnerable regions.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TAB4_STATIC, unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
 
     # Column 1
     with col1:
         st.subheader("Climate Projections to 2050")
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=projections_df["Year"], y=projections_df["Projected Temp Change"],
-            mode='lines+markers', name='Temperature Change',
-            line=dict(color='red', width=3)
-        ))
-        fig.add_trace(go.Scatter(
-            x=projections_df["Year"], y=projections_df["Projected Rainfall Change"],
-            mode='lines+markers', name='Rainfall Change',
-            line=dict(color='blue', width=3),
-            yaxis="y2"
-        ))
-
-        # FIXED SECTION - Updated axis title styling
-        fig.update_layout(
-            title="Projected Climate Change (2024-2050)",
-            yaxis=dict(
-                title=dict(text="Temperature Change (°C)", font=dict(color="red"))
-            ),
-            yaxis2=dict(
-                title=dict(text="Rainfall Change (%)", font=dict(color="blue")),
-                overlaying="y",
-                side="right"
-            ),
-            showlegend=True
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_projection_fig(), use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("### Crop Yield Projections")
         scenario = st.radio("Select Climate Scenario", 
@@ -583,77 +857,18 @@ with tab4:
                             "Moderate Emissions (RCP 4.5)", 
                             "High Emissions (RCP 8.5)"])
         
-        # Simulate yield projections
-        years = list(range(2024, 2050))
-        if "Low" in scenario:
-            yields = [100 - 0.5 * (year - 2024) for year in years]
-        elif "Moderate" in scenario:
-            yields = [100 - 1.0 * (year - 2024) for year in years]
-        else:
-            yields = [100 - 2.0 * (year - 2024) for year in years]
-        
-        yield_df = pd.DataFrame({"Year": years, "Projected Yield (%)": yields})
-        
-        fig = px.line(yield_df, x="Year", y="Projected Yield (%)", 
-                     title=f"Projected Crop Yield: {scenario}",
-                     markers=True)
-        fig.update_layout(yaxis_title="Yield as % of 2020 Baseline")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_yield_fig(scenario), use_container_width=True, config=_PLOTLY_CFG)
 
 
     # Column 2
     with col2:
         st.subheader("Regional Vulnerability in 2050")
         
-        # Vulnerability map data
-        vulnerability = {
-            "Region": list(regions.keys()) + ["Other Areas"],
-            "Latitude": [-33.5, -28.0, -29.0, -28.5],
-            "Longitude": [19.5, 27.0, 31.0, 24.0],
-            "Risk Level": ["High", "Very High", "Medium", "Low"],
-            "Risk Score": [8.2, 9.1, 6.5, 3.2],
-            "Main Threat": ["Drought", "Heat Stress", "Flooding", "Moderate Change"]
-        }
-        vuln_df = pd.DataFrame(vulnerability)
-        
-        fig = px.scatter_mapbox(vuln_df, lat="Latitude", lon="Longitude", 
-                               color="Risk Level", size="Risk Score",
-                               hover_name="Region", hover_data=["Main Threat"],
-                               color_discrete_map={
-                                   "Very High": "red",
-                                   "High": "orange",
-                                   "Medium": "yellow",
-                                   "Low": "green"
-                               },
-                               zoom=5, height=500)
-        
-        fig.update_layout(mapbox_style="open-street-map")
-        fig.update_layout(margin={"r":0,"t":0,"l":0,"b":0})
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_vuln_map_fig(), use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("### Adaptation Strategies Effectiveness")
         
-        strategies = [
-            "Drought-resistant crops",
-            "Precision irrigation",
-            "Crop rotation",
-            "Soil conservation",
-            "Agroforestry"
-        ]
-        effectiveness = [85, 75, 60, 70, 65]
-        cost = [40, 70, 30, 50, 60]
-        
-        strat_df = pd.DataFrame({
-            "Strategy": strategies,
-            "Effectiveness (%)": effectiveness,
-            "Cost (relative)": cost
-        })
-        
-        fig = px.bar(strat_df, x="Strategy", y="Effectiveness (%)",
-                    color="Cost (relative)",
-                    title="Effectiveness of Adaptation Strategies",
-                    color_continuous_scale=px.colors.sequential.Viridis)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_strategies_fig(), use_container_width=True, config=_PLOTLY_CFG)
         
         st.markdown("""
         <div style="background-color: #191919; padding: 10px; border-radius: 5px; margin-top: 20px;">
@@ -670,12 +885,7 @@ with tab4:
 
 # Tab 5: Recommendations
 with tab5:
-    st.header("Adaptation Recommendations")
-    st.markdown("""
-    <div style="background-color: #191919; padding: 15px; border-radius: 10px; margin-bottom: 20px;">
-        <p>Evidence-based strategies to enhance climate resilience in South African agriculture.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_TAB5_STATIC, unsafe_allow_html=True)
     
     col1, col2 = st.columns([1, 1])
     
@@ -697,8 +907,8 @@ with tab5:
             </div>
             """, unsafe_allow_html=True)
             
-            st.image("https://upload.wikimedia.org/wikipedia/commons/1/1f/Drip_irrigation_%282552390830%29.jpg", 
-                     caption="Drip irrigation can reduce water usage by 30-50%", width=400)
+            image_url = "https://upload.wikimedia.org/wikipedia/commons/1/1f/Drip_irrigation_%282552390830%29.jpg"
+            image_caption = "Drip irrigation can reduce water usage by 30-50%"
             
         elif region == "Free State Maize":
             st.markdown("""
@@ -713,8 +923,8 @@ with tab5:
             </div>
             """, unsafe_allow_html=True)
             
-            st.image("https://upload.wikimedia.org/wikipedia/commons/c/cd/Cornfield_in_South_Africa.jpg", 
-                     caption="New heat-tolerant varieties can maintain yields at higher temperatures", width=400)
+            image_url = "https://upload.wikimedia.org/wikipedia/commons/c/cd/Cornfield_in_South_Africa.jpg"
+            image_caption = "New heat-tolerant varieties can maintain yields at higher temperatures"
             
         else:  # KZN Sugarcane
             st.markdown("""
@@ -729,72 +939,21 @@ with tab5:
             </div>
             """, unsafe_allow_html=True)
             
-            st.image("https://upload.wikimedia.org/wikipedia/commons/9/96/Contour_Farming04_%2823972930457%29.jpg", 
-                     caption="Contour planting reduces soil erosion during heavy rains", width=400)
+            image_url = "https://upload.wikimedia.org/wikipedia/commons/9/96/Contour_Farming04_%2823972930457%29.jpg"
+            image_caption = "Contour planting reduces soil erosion during heavy rains"
+        
+        try:
+            st.image(fetch_image(image_url), caption=image_caption, width=400, output_format="JPEG")
+        except Exception:
+            # Let the browser fetch the image directly if the server can't
+            st.image(image_url, caption=image_caption, width=400)
 
 
     # Column 2
     with col2:
-        st.subheader("Policy Recommendations")
-        
-        st.markdown("""
-        <div style="background-color: #0d0d0d; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
-            <h4>National Climate Adaptation Framework</h4>
-            <ol>
-                <li>Establish a National Climate Resilience Fund for Agriculture</li>
-                <li>Integrate climate risk assessments into agricultural planning</li>
-                <li>Develop early warning systems for extreme weather events</li>
-                <li>Promote climate-smart agricultural practices nationwide</li>
-                <li>Support research on climate-resilient crop varieties</li>
-            </ol>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("### Implementation Timeline")
+        st.markdown(_TAB5_POLICY_STATIC, unsafe_allow_html=True)
         
-        timeline_data = {
-            "Phase": ["Short-Term (1-3 years)", "Medium-Term (3-7 years)", "Long-Term (7-15 years)"],
-            "Key Actions": [
-                "Pilot adaptation projects, farmer training, early warning systems",
-                "Scale successful pilots, develop resilient supply chains, policy reform",
-                "Transformational change, climate-resilient infrastructure, diversified agricultural economy"
-            ],
-            "Estimated Cost (ZAR billion)": [3.5, 8.2, 15.0]
-        }
-        timeline_df = pd.DataFrame(timeline_data)
-        
-        st.dataframe(timeline_df, hide_index=True, use_container_width=True)
-        
-        st.markdown("### Funding Opportunities")
-        
-        funding = {
-            "Source": [
-                "Green Climate Fund", 
-                "World Bank Climate Investment Funds",
-                "National Treasury",
-                "Private Sector Partnerships"
-            ],
-            "Focus Area": [
-                "Large-scale adaptation projects",
-                "Technology transfer and capacity building",
-                "Domestic subsidy programs",
-                "Innovation and market-based solutions"
-            ],
-            "Potential Amount (ZAR billion)": [5.0, 3.2, 2.5, 4.0]
-        }
-        funding_df = pd.DataFrame(funding)
-        
-        fig = px.bar(funding_df, x="Source", y="Potential Amount (ZAR billion)",
-                    color="Focus Area", 
-                    title="Climate Adaptation Funding Sources")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_funding_fig(), use_container_width=True, config=_PLOTLY_CFG)
 
 # Footer
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; font-size: 14px; padding-top: 20px;">
-    <p>Climate Change Impact on South African Agriculture Dashboard • Developed with Streamlit</p>
-    <p>Data Sources: Sentinel-2 Satellite Imagery, South African Weather Service, Agricultural Research Council</p>
-    <p>Disclaimer: This is a demonstration tool. For official assessments, consult relevant authorities.</p>
-</div>
-""", unsafe_allow_html=True)
+st.html(_FOOTER_HTML)